@@ -62,10 +62,10 @@ fn test_ecommerce_safe_parameterized_query() {
     
     // The safe method 'get_user_orders' should NOT be marked as a vulnerability
     // We check if any sink uses 'get_user_orders' context which is hard statically
-    // Instead we check if we flagged line 38 (execute(query, (user_id,)))
+    // Instead we check if we flagged the parameterized execute(query, (user_id,))
     // If our logic works, that relevant sink should be ignored or marked safe logic.
     // Our current Prover gathers ALL sinks. 
-    // We verify that the sink at line 38 is NOT in the reported vulnerabilities list?
+    // We verify that this sink is NOT in the reported vulnerabilities list?
     // Or if it is, it should have empty tainted_vars if analysis is perfect?
     // Actually, parameterized queries are filtered out by `is_vulnerable_sink` logic if implemented optimally.
     // Let's assert that we found exactly 1 SQLi (the vulnerable one)
@@ -196,7 +196,7 @@ fn test_deser_marshal() {
 fn test_complex_recursion_taint() {
     let result = analyze_file("tests/integration_targets/complex_logic.py");
     // Prover must follow 'recursive_taint'
-    let sink = result.sinks.iter().find(|s| s.code_snippet.contains("echo {result}")).unwrap();
+    let sink = result.sinks.iter().find(|s| s.code_snippet.contains("\"echo \" + result")).unwrap();
     assert!(sink.tainted_vars.contains(&"result".to_string()));
 }
 
@@ -204,7 +204,7 @@ fn test_complex_recursion_taint() {
 fn test_complex_loop_accumulation() {
     let result = analyze_file("tests/integration_targets/complex_logic.py");
     // 'unsafe_val' should be tainted
-    let sink = result.sinks.iter().find(|s| s.code_snippet.contains("echo {unsafe_val}")).unwrap();
+    let sink = result.sinks.iter().find(|s| s.code_snippet.contains("\"echo \" + unsafe_val")).unwrap();
     assert!(sink.tainted_vars.contains(&"unsafe_val".to_string()));
 }
 
@@ -292,7 +292,7 @@ fn test_sqli_format_function() {
     assert!(result.sinks.iter().any(|s| 
         s.code_snippet.contains("cursor.execute(query)") && 
         s.tainted_vars.contains(&"query".to_string()) &&
-        s.line > 15 && s.line < 25 // Approximate location
+        s.line > 23 && s.line < 33 // Approximate location
     ));
 }
 
@@ -305,7 +305,7 @@ fn test_sqli_percent_formatting() {
     assert!(result.sinks.iter().any(|s| 
         s.code_snippet.contains("cursor.execute(query)") && 
         s.tainted_vars.contains(&"query".to_string()) &&
-        s.line > 25 && s.line < 35
+        s.line > 33 && s.line < 43
     ));
 }
 
@@ -316,7 +316,7 @@ fn test_sqli_string_concatenation() {
     assert!(result.sinks.iter().any(|s| 
         s.code_snippet.contains("cursor.execute(query)") && 
         s.tainted_vars.contains(&"query".to_string()) &&
-        s.line > 35 && s.line < 45
+        s.line > 43 && s.line < 53
     ));
 }
 
@@ -327,7 +327,7 @@ fn test_sqli_aug_assign_concat() {
     assert!(result.sinks.iter().any(|s| 
         s.code_snippet.contains("cursor.execute(query)") && 
         s.tainted_vars.contains(&"query".to_string()) &&
-        s.line > 45
+        s.line > 53
     ));
 }
 
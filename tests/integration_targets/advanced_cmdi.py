@@ -1,7 +1,6 @@
 
 import os
 import subprocess
-import commands # Legacy but good to test
 from flask import Flask, request
 
 app = Flask(__name__)
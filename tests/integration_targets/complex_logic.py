@@ -1,5 +1,6 @@
 from flask import Flask, request
 import os
+import shlex
 
 app = Flask(__name__)
 
@@ -43,7 +44,7 @@ def test_recursion():
     result = recursive_taint(user_input, 5)
     
     # SINK: Vulnerable
-    os.system(f"echo {result}")
+    os.system("echo " + result)
     return "Done"
 
 @app.route('/complex/loop_safe')
@@ -54,7 +55,7 @@ def test_loop_safe():
     safe_val = loop_based_sanitization(user_input)
     
     # SINK: Should be SAFE
-    os.system(f"echo {safe_val}")
+    os.system("echo " + safe_val)
     return "Safe"
 
 @app.route('/complex/loop_unsafe')
@@ -65,7 +66,7 @@ def test_loop_unsafe():
     unsafe_val = loop_taint_accumulation(user_input)
     
     # SINK: Vulnerable
-    os.system(f"echo {unsafe_val}")
+    os.system("echo " + unsafe_val)
     return "Unsafe"
 
 @app.route('/complex/conditional_sanitization')
@@ -77,7 +78,6 @@ def test_conditional():
     
     if mode == "safe":
         # Sanitization path
-        import shlex
         command = f"echo {shlex.quote(user_input)}"
     
     # VULNERABLE: If mode != safe, we execute tainted command
@@ -1,12 +1,21 @@
 import sqlite3
+import threading
+
+# Per-thread sqlite3 connection
+_local = threading.local()
+
+def get_connection():
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = sqlite3.connect("data.db", cached_statements=256)
+    return conn
 
 def run_query(query_string):
     """
     Executes a query.
     Sink: cursor.execute
     """
-    conn = sqlite3.connect("data.db")
-    cursor = conn.cursor()
+    cursor = get_connection().cursor()
     # Vulnerable SINK
     cursor.execute(query_string)
     return cursor.fetchall()
@@ -2,7 +2,7 @@ import pickle
 import yaml
 import marshal
 from flask import Flask, request
-import base64
+import binascii
 
 app = Flask(__name__)
 
@@ -19,7 +19,7 @@ def restore_session():
     # VULNERABLE: pickle.loads
     # Decodes user input and deserializes it
     try:
-        decoded = base64.b64decode(cookie_data)
+        decoded = binascii.a2b_base64(cookie_data)
         session_obj = pickle.loads(decoded) # SINK
         return f"Welcome back {session_obj.username}"
     except:
@@ -1,4 +1,5 @@
 import sqlite3
+import threading
 from flask import Flask, request, jsonify
 
 app = Flask(__name__)
@@ -6,9 +7,14 @@ app = Flask(__name__)
 class DatabaseManager:
     def __init__(self, db_name="store.db"):
         self.db_name = db_name
+        # Per-thread sqlite3 connection
+        self._local = threading.local()
 
     def get_connection(self):
-        return sqlite3.connect(self.db_name)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.db_name)
+        return conn
 
     def query_products(self, search_term, category):
         """
@@ -25,11 +31,10 @@ class DatabaseManager:
         # Vulnerable part
         final_query = f"{base_query} AND name LIKE '%{search_term}%'"
         
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            # Sink!
-            cursor.execute(final_query)
-            return cursor.fetchall()
+        cursor = self.get_connection().cursor()
+        # Sink!
+        cursor.execute(final_query)
+        return cursor.fetchall()
 
     def get_user_orders(self, user_id):
         """
@@ -37,10 +42,9 @@ class DatabaseManager:
         Should NOT be detected as vulnerable.
         """
         query = "SELECT * FROM orders WHERE user_id = ?"
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, (user_id,))
-            return cursor.fetchall()
+        cursor = self.get_connection().cursor()
+        cursor.execute(query, (user_id,))
+        return cursor.fetchall()
 
 db_manager = DatabaseManager()
 
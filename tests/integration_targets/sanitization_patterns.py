@@ -17,7 +17,7 @@ def test_shlex():
     user_input = request.args.get('input')
     # shlex.quote is safe
     safe_input = shlex.quote(user_input)
-    os.system(f"echo {safe_input}")
+    os.system("echo " + safe_input)
     return "Safe"
 
 @app.route('/fp/int_cast')
@@ -40,7 +40,7 @@ def string_challenge():
     # Must start with "magic_" and be 10 chars long
     if code.startswith("magic_") and len(code) == 10:
          # SINK
-         os.system(f"echo {code}")
+         os.system("echo " + code)
          return "Exploited"
          
     return "Safe"
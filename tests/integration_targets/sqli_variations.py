@@ -1,15 +1,23 @@
-
 import sqlite3
+import threading
 from flask import Flask, request
 
 app = Flask(__name__)
-db = sqlite3.connect("test.db")
+
+# Per-thread sqlite3 connection
+_local = threading.local()
+
+def get_connection():
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = sqlite3.connect("test.db")
+    return conn
 
 @app.route("/sqli_1")
 def test_executemany_unsafe():
     # VULNERABLE: executemany with string formatting
     users_data = [(request.args.get('id'), "admin")]
-    cursor = db.cursor()
+    cursor = get_connection().cursor()
     # While executemany is for bulk, if the query itself is formatted string, it's unsafe.
     query = "INSERT INTO logs VALUES ('{}', ?)".format(users_data[0][0])
     cursor.executemany(query, users_data) 
@@ -20,7 +28,7 @@ def test_format_function():
     # VULNERABLE: .format()
     uid = request.args.get('uid')
     query = "SELECT * FROM users WHERE id = {}".format(uid)
-    cursor = db.cursor()
+    cursor = get_connection().cursor()
     cursor.execute(query)
     return "done"
 
@@ -29,7 +37,7 @@ def test_percent_formatting():
     # VULNERABLE: % formatting
     name = request.args.get('name')
     query = "SELECT * FROM users WHERE name = '%s'" % name
-    cursor = db.cursor()
+    cursor = get_connection().cursor()
     cursor.execute(query)
     return "done"
 
@@ -38,7 +46,7 @@ def test_string_concatenation():
     # VULNERABLE: + operator
     cat = request.args.get('category')
     query = "SELECT * FROM items WHERE category = '" + cat + "'"
-    cursor = db.cursor()
+    cursor = get_connection().cursor()
     cursor.execute(query)
     return "done"
 
@@ -49,6 +57,6 @@ def test_aug_assign_concat():
     query = "SELECT * FROM items WHERE name LIKE '%"
     query += search
     query += "%'"
-    cursor = db.cursor()
+    cursor = get_connection().cursor()
     cursor.execute(query)
     return "done"